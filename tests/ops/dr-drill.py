@@ -3,19 +3,24 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import datetime as dt
+import functools
 import gzip
 import hashlib
 import hmac
+import http.client
 import json
 import os
 import pathlib
+import shutil
 import subprocess
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Dict, Optional, Tuple
+import types
+import urllib.parse
+from typing import IO, Dict, List, Mapping, Optional, Tuple
 
 
 def env(name: str, default: str) -> str:
@@ -23,6 +28,22 @@ def env(name: str, default: str) -> str:
     return value if value not in (None, "") else default
 
 
+def env_int(name: str, default: str, low: int, high: int) -> int:
+    # Settings are read at import, before main()'s error handling; report in
+    # the same stdout format instead of failing with a traceback, or only once
+    # the value is first used late in the drill.
+    value = env(name, default)
+    try:
+        number: Optional[int] = int(value)
+    except ValueError:
+        number = None
+    if number is None or not low <= number <= high:
+        print("DR_STATUS=FAIL")
+        print(f"ERROR=invalid {name}={value!r}: expected an integer {low}-{high}")
+        sys.exit(1)
+    return number
+
+
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[2]
 ARTIFACTS_DIR = pathlib.Path(env("ARTIFACTS_DIR", str(ROOT_DIR / ".artifacts" / "dr-drill")))
 ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -43,6 +64,12 @@ DB_NAME = env("DB_NAME", "zist")
 DB_USER = env("DB_USER", "dev")
 BACKUP_DIR = pathlib.Path(env("BACKUP_DIR", "/tmp/zist-drill-backups"))
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+# Level 1 is several times faster than gzip's default 9 on text dumps for a
+# small size penalty, and backup duration is part of the reported drill output.
+BACKUP_COMPRESS_LEVEL = env_int("BACKUP_COMPRESS_LEVEL", "1", 1, 9)
+COPY_CHUNK_BYTES = 1 << 20
+# pigz writes standard gzip using every core; fall back to the gzip module.
+PIGZ = shutil.which("pigz")
 
 HOST_SCOPES = (
     "zist.listings.read zist.listings.manage "
@@ -50,7 +77,18 @@ HOST_SCOPES = (
     "zist.payments.create zist.webhooks.manage"
 )
 GUEST_SCOPES = "zist.listings.read zist.bookings.read zist.bookings.manage zist.payments.create"
+LISTING_TEMPLATE = {
+    "description": "dr drill listing",
+    "city": "Samarkand",
+    "country": "UZ",
+    "pricePerNight": "170000.00",
+    "currency": "UZS",
+    "maxGuests": 2,
+    "instantBook": True,
+}
+PHOTO_PAYLOAD = {"url": "https://example.com/dr.jpg", "caption": "cover"}
 APP_CONTAINERS = ["zist-gateway", "zist-listings", "zist-bookings", "zist-payments", "zist-web"]
+STOP_GRACE_SECONDS = env("STOP_GRACE_SECONDS", "2")
 
 
 def log(msg: str) -> None:
@@ -61,30 +99,79 @@ def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# json.dumps builds a new JSONEncoder on every call whenever any option is
+# passed; build the compact one once and reuse it for every request body.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+
+def encode_json(payload: dict) -> bytes:
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+# Keep-alive connections, one per (thread, host). http.client connections are
+# not thread-safe, and wait_stack_health probes from a worker pool.
+_conn_local = threading.local()
+
+
+def _connection(parts: urllib.parse.SplitResult) -> Tuple[http.client.HTTPConnection, bool]:
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(parts.netloc)
+    if conn is not None:
+        return conn, True
+    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = conns[parts.netloc] = conn_cls(parts.netloc)
+    return conn, False
+
+
+def _drop_connection(netloc: str) -> None:
+    conn = getattr(_conn_local, "conns", {}).pop(netloc, None)
+    if conn is not None:
+        conn.close()
+
+
 def request_json(
     method: str,
     url: str,
     payload: Optional[dict] = None,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     timeout: float = 10,
+    body: Optional[bytes] = None,
 ) -> Tuple[int, bytes]:
-    body: Optional[bytes] = None
-    req_headers = dict(headers or {})
+    req_headers = headers or {}
     if payload is not None:
-        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
-        req_headers.setdefault("Content-Type", "application/json")
-
-    req = urllib.request.Request(url=url, data=body, method=method)
-    for key, value in req_headers.items():
-        req.add_header(key, value)
-
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.getcode(), resp.read()
-    except urllib.error.HTTPError as http_err:
-        return http_err.code, http_err.read()
-    except Exception as err:  # noqa: BLE001
-        return 0, str(err).encode("utf-8")
+        body = encode_json(payload)
+    if body is not None and "Content-Type" not in req_headers:
+        req_headers = {**req_headers, "Content-Type": "application/json"}
+
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    while True:
+        conn, reused = _connection(parts)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body=body, headers=req_headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as err:
+            _drop_connection(parts.netloc)
+            if reused:
+                # The server closed an idle keep-alive socket (e.g. after a
+                # container restart); retry once on a fresh connection.
+                continue
+            return 0, str(err).encode("utf-8")
+        except Exception as err:  # noqa: BLE001
+            _drop_connection(parts.netloc)
+            return 0, str(err).encode("utf-8")
+        if resp.will_close:
+            _drop_connection(parts.netloc)
+        return resp.status, data
 
 
 def parse_json(data: bytes) -> dict:
@@ -96,67 +183,135 @@ def parse_json(data: bytes) -> dict:
         return {}
 
 
-def auth_headers(user_id: str, tenant_id: str, email: str, scopes: str) -> Dict[str, str]:
-    return {
-        "X-User-ID": user_id,
-        "X-Tenant-ID": tenant_id,
-        "X-User-Email": email,
-        "X-User-Scopes": scopes,
-    }
+@functools.lru_cache(maxsize=8)
+def auth_headers(user_id: str, tenant_id: str, email: str, scopes: str) -> Mapping[str, str]:
+    # The drill only ever uses a handful of identities; hand out one shared,
+    # read-only mapping per identity instead of building a dict per request.
+    return types.MappingProxyType(
+        {
+            "X-User-ID": user_id,
+            "X-Tenant-ID": tenant_id,
+            "X-User-Email": email,
+            "X-User-Scopes": scopes,
+        }
+    )
+
+
+# Keyed once; webhook_headers copies it so each signature skips the key schedule.
+_WEBHOOK_MAC = hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256) if WEBHOOK_SECRET.strip() else None
 
 
 def webhook_headers(payload_bytes: bytes) -> Dict[str, str]:
-    if not WEBHOOK_SECRET.strip():
+    if _WEBHOOK_MAC is None:
         return {}
     ts = str(now_ms())
-    mac = hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
-    mac.update((ts + "." + payload_bytes.decode("utf-8")).encode("utf-8"))
+    mac = _WEBHOOK_MAC.copy()
+    mac.update(ts.encode("ascii"))
+    mac.update(b".")
+    mac.update(payload_bytes)
     return {
         "x-gp-timestamp": ts,
         "x-gp-signature": "v1=" + mac.hexdigest(),
     }
 
 
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    # Short first retries keep the measured RTO close to the real recovery
+    # time; the cap keeps long waits from hammering the service.
+    return min(cap, base * 1.5**attempt)
+
+
 def wait_http_health(url: str, timeout_sec: int = 180) -> bool:
     deadline = time.time() + timeout_sec
+    attempt = 0
     while time.time() < deadline:
         code, _ = request_json("GET", url, timeout=3)
         if code == 200:
             return True
-        time.sleep(2)
+        time.sleep(backoff_delay(attempt, base=0.1, cap=2.0))
+        attempt += 1
     return False
 
 
-def wait_stack_health() -> bool:
+def wait_stack_health(timeout_sec: int = 180) -> bool:
     targets = [
         f"{GATEWAY_URL}/healthz",
         f"{LISTINGS_URL}/healthz",
         f"{BOOKINGS_URL}/healthz",
         f"{PAYMENTS_URL}/healthz",
     ]
-    return all(wait_http_health(t, timeout_sec=180) for t in targets)
+    # Probe all services concurrently so the wait is bounded by the slowest
+    # one rather than the sum of all of them (this is on the restore RTO path).
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(targets))
+    try:
+        futures = [pool.submit(wait_http_health, t, timeout_sec) for t in targets]
+        for future in concurrent.futures.as_completed(futures, timeout=timeout_sec + 10):
+            if not future.result():
+                return False
+        return True
+    except concurrent.futures.TimeoutError:
+        return False
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def container_status(cid: str) -> str:
+    inspect_cmd = [
+        "docker",
+        "inspect",
+        "-f",
+        "{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}",
+        cid,
+    ]
+    try:
+        return subprocess.check_output(inspect_cmd, text=True, stderr=subprocess.DEVNULL).strip()
+    except subprocess.CalledProcessError:
+        return ""
 
 
 def wait_service_healthy(service_name: str, timeout_sec: int = 180) -> bool:
     cid = f"zist-{service_name}"
 
+    # One inspect for the current state, then a single `docker events` stream
+    # instead of forking an inspect every couple of seconds. --since replays
+    # anything that happened between the inspect and the subscription.
+    since = f"{time.time():.3f}"
     deadline = time.time() + timeout_sec
-    while time.time() < deadline:
-        inspect_cmd = [
-            "docker",
-            "inspect",
-            "-f",
-            "{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}",
-            cid,
-        ]
+    if container_status(cid) in ("healthy", "running"):
+        return True
+
+    events_cmd = [
+        "docker",
+        "events",
+        "--filter",
+        f"container={cid}",
+        "--filter",
+        "event=health_status",
+        "--format",
+        "{{.Action}}",
+        "--since",
+        since,
+        "--until",
+        str(int(deadline)),
+    ]
+    with subprocess.Popen(events_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
         try:
-            status = subprocess.check_output(inspect_cmd, text=True).strip()
-        except subprocess.CalledProcessError:
-            status = ""
-        if status in ("healthy", "running"):
+            for line in proc.stdout:
+                if line.strip() == "health_status: healthy":
+                    return True
+        finally:
+            proc.kill()
+
+    # The stream normally ends at --until, but it also ends early if `docker
+    # events` itself fails; poll out whatever time is left so that doesn't
+    # cut the wait short.
+    while True:
+        if container_status(cid) in ("healthy", "running"):
             return True
-        time.sleep(2)
-    return False
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(2, remaining))
 
 
 def recreate_payments(internal_token: str) -> None:
@@ -165,8 +320,24 @@ def recreate_payments(internal_token: str) -> None:
     compose_env["SESSION_SECRET"] = compose_env.get("SESSION_SECRET") or "dev-session-secret"
     compose_env["MASHGATE_WEBHOOK_SECRET"] = compose_env.get("MASHGATE_WEBHOOK_SECRET") or WEBHOOK_SECRET or "dev-whsec"
     compose_env["INTERNAL_TOKEN"] = internal_token
+    # The token is baked into the container env, so a compose recreate is
+    # unavoidable (docker update cannot change env). --no-deps skips reconciling
+    # db, and the short timeout avoids the 10s SIGTERM grace when replacing the
+    # old container; this sits on the rollback RTO path and runs three times
+    # per drill.
     subprocess.check_call(
-        ["docker", "compose", "-f", COMPOSE_FILE, "up", "-d", "payments"],
+        [
+            "docker",
+            "compose",
+            "-f",
+            COMPOSE_FILE,
+            "up",
+            "-d",
+            "--no-deps",
+            "--timeout",
+            STOP_GRACE_SECONDS,
+            "payments",
+        ],
         env=compose_env,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
@@ -174,17 +345,10 @@ def recreate_payments(internal_token: str) -> None:
 
 
 def create_active_listing(title: str) -> str:
+    # create -> photo -> publish depend on each other and go out back to back
+    # on the same keep-alive connection to the listings service.
     headers = auth_headers("dr-host", TENANT_ID, "dr-host@zist.local", HOST_SCOPES)
-    payload = {
-        "title": title,
-        "description": "dr drill listing",
-        "city": "Samarkand",
-        "country": "UZ",
-        "pricePerNight": "170000.00",
-        "currency": "UZS",
-        "maxGuests": 2,
-        "instantBook": True,
-    }
+    payload = {"title": title, **LISTING_TEMPLATE}
     code, body = request_json("POST", f"{LISTINGS_URL}/listings", payload=payload, headers=headers)
     if code != 201:
         raise RuntimeError(f"create listing failed: code={code} body={body.decode('utf-8', 'ignore')}")
@@ -195,7 +359,7 @@ def create_active_listing(title: str) -> str:
     pcode, pbody = request_json(
         "POST",
         f"{LISTINGS_URL}/listings/{listing_id}/photos",
-        payload={"url": "https://example.com/dr.jpg", "caption": "cover"},
+        payload=PHOTO_PAYLOAD,
         headers=headers,
     )
     if pcode != 201:
@@ -235,9 +399,10 @@ def send_payment_captured(booking_id: str, suffix: str) -> Tuple[int, str]:
         "tenant_id": TENANT_ID,
         "data": {"metadata": {"bookingId": booking_id}},
     }
-    payload_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    payload_bytes = encode_json(payload)
     headers = webhook_headers(payload_bytes)
-    code, body = request_json("POST", f"{PAYMENTS_URL}/webhooks/mashgate", payload=payload, headers=headers)
+    # Send exactly the bytes that were signed rather than re-serializing.
+    code, body = request_json("POST", f"{PAYMENTS_URL}/webhooks/mashgate", headers=headers, body=payload_bytes)
     return code, body.decode("utf-8", "ignore")
 
 
@@ -248,68 +413,161 @@ def booking_status(booking_id: str) -> Tuple[int, str]:
     return code, status
 
 
+def listing_code(listing_id: str) -> int:
+    code, _ = request_json("GET", f"{LISTINGS_URL}/listings/{listing_id}", headers={"X-Tenant-ID": TENANT_ID})
+    return code
+
+
 def wait_booking_status(booking_id: str, expected: str, timeout_sec: int = 30) -> bool:
     deadline = time.time() + timeout_sec
+    attempt = 0
     while time.time() < deadline:
         code, status = booking_status(booking_id)
         if code == 200 and status == expected:
             return True
-        time.sleep(0.25)
+        time.sleep(backoff_delay(attempt, base=0.025, cap=0.5))
+        attempt += 1
     return False
 
 
-def backup_database(backup_file: pathlib.Path) -> int:
-    dump = subprocess.check_output(
-        ["docker", "exec", DB_CONTAINER, "pg_dump", "-U", DB_USER, "-d", DB_NAME],
-        stderr=subprocess.STDOUT,
-    )
-    with gzip.open(backup_file, "wb") as fh:
-        fh.write(dump)
-    return len(dump)
+def copy_stream(src: IO[bytes], dst: IO[bytes]) -> int:
+    copied = 0
+    while True:
+        chunk = src.read(COPY_CHUNK_BYTES)
+        if not chunk:
+            return copied
+        dst.write(chunk)
+        copied += len(chunk)
 
 
-def restore_database(backup_file: pathlib.Path) -> None:
-    with gzip.open(backup_file, "rb") as fh:
-        data = fh.read()
+def compress_to_file(src: IO[bytes], backup_file: pathlib.Path) -> int:
+    if not PIGZ:
+        with gzip.open(backup_file, "wb", compresslevel=BACKUP_COMPRESS_LEVEL) as fh:
+            return copy_stream(src, fh)
 
-    # Ensure no active app connections during drop/create.
-    subprocess.check_call(["docker", "stop", *APP_CONTAINERS], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    pigz_cmd = [PIGZ, "-c", f"-{BACKUP_COMPRESS_LEVEL}", "-p", str(os.cpu_count() or 1)]
+    with open(backup_file, "wb") as out:
+        proc = subprocess.Popen(pigz_cmd, stdin=subprocess.PIPE, stdout=out)
+        try:
+            size = copy_stream(src, proc.stdin)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, pigz_cmd)
+    return size
+
+
+def pipe_backup_into(backup_file: pathlib.Path, cmd: List[str]) -> None:
+    if PIGZ:
+        # pigz feeds cmd through an OS pipe, so decompression and replay run
+        # concurrently and the dump never passes through Python at all.
+        pigz_cmd = [PIGZ, "-dc", str(backup_file)]
+        pigz = subprocess.Popen(pigz_cmd, stdout=subprocess.PIPE)
+        proc = subprocess.Popen(cmd, stdin=pigz.stdout)
+        pigz.stdout.close()
+        proc.wait()
+        pigz.wait()
+    else:
+        pigz = None
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            with proc.stdin, gzip.open(backup_file, "rb") as fh:
+                copy_stream(fh, proc.stdin)
+        except BrokenPipeError:
+            # cmd exited before consuming the dump; its exit status says why.
+            pass
+        proc.wait()
 
-    terminate_sql = (
-        "SELECT pg_terminate_backend(pid) "
-        "FROM pg_stat_activity "
-        "WHERE datname = '" + DB_NAME + "' AND pid <> pg_backend_pid();"
-    )
-    subprocess.check_call(
-        [
-            "docker",
-            "exec",
-            DB_CONTAINER,
-            "psql",
-            "-U",
-            DB_USER,
-            "-d",
-            "postgres",
-            "-v",
-            "ON_ERROR_STOP=1",
-            "-c",
-            terminate_sql,
-            "-c",
-            f"DROP DATABASE IF EXISTS {DB_NAME};",
-            "-c",
-            f"CREATE DATABASE {DB_NAME};",
-        ],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    if pigz is not None and pigz.returncode != 0:
+        raise subprocess.CalledProcessError(pigz.returncode, pigz_cmd)
+
+
+def backup_database(backup_file: pathlib.Path) -> int:
+    # Stream pg_dump straight into the compressor so the dump is never held
+    # in memory and compression overlaps with the dump itself.
+    dump_cmd = ["docker", "exec", DB_CONTAINER, "pg_dump", "-U", DB_USER, "-d", DB_NAME]
+    proc = subprocess.Popen(dump_cmd, stdout=subprocess.PIPE)
+    try:
+        size = compress_to_file(proc.stdout, backup_file)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, dump_cmd)
+    return size
+
+
+def running_containers(containers: List[str]) -> List[str]:
+    inspect_cmd = ["docker", "inspect", "-f", "{{.Name}} {{.State.Status}}", *containers]
+    try:
+        output = subprocess.check_output(inspect_cmd, text=True, stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError as err:
+        # Still prints the containers it did find when some are missing.
+        output = err.output or ""
+    running = set()
+    for line in output.splitlines():
+        name, _, status = line.strip().partition(" ")
+        if status == "running":
+            running.add(name.lstrip("/"))
+    return [cid for cid in containers if cid in running]
 
-    subprocess.run(
-        ["docker", "exec", "-i", DB_CONTAINER, "psql", "-U", DB_USER, "-d", DB_NAME],
-        input=data,
-        check=True,
-    )
 
-    subprocess.check_call(["docker", "start", *APP_CONTAINERS], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+def restore_database(backup_file: pathlib.Path) -> None:
+    # Freeze the app containers instead of stopping them: pausing is near
+    # instant and the services resume warm rather than cold-starting. Their
+    # frozen DB sessions are killed by pg_terminate_backend below, and
+    # database/sql reconnects on the next query after unpause.
+    # Only running containers can be paused; anything already down holds no
+    # DB sessions and is left as it is.
+    paused: List[str] = []
+    try:
+        paused = running_containers(APP_CONTAINERS)
+        if paused:
+            subprocess.check_call(["docker", "pause", *paused], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        terminate_sql = (
+            "SELECT pg_terminate_backend(pid) "
+            "FROM pg_stat_activity "
+            "WHERE datname = '" + DB_NAME + "' AND pid <> pg_backend_pid();"
+        )
+        subprocess.check_call(
+            [
+                "docker",
+                "exec",
+                DB_CONTAINER,
+                "psql",
+                "-U",
+                DB_USER,
+                "-d",
+                "postgres",
+                "-v",
+                "ON_ERROR_STOP=1",
+                "-c",
+                terminate_sql,
+                "-c",
+                f"DROP DATABASE IF EXISTS {DB_NAME};",
+                "-c",
+                f"CREATE DATABASE {DB_NAME};",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        pipe_backup_into(backup_file, ["docker", "exec", "-i", DB_CONTAINER, "psql", "-U", DB_USER, "-d", DB_NAME])
+    finally:
+        # Runs even when the pause itself partly failed. Report rather than
+        # raise so a failed unpause does not mask the original error.
+        if paused:
+            unpause_code = subprocess.call(
+                ["docker", "unpause", *paused],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if unpause_code != 0:
+                log(f"WARNING: docker unpause exited {unpause_code} for: {' '.join(paused)}")
 
 
 def main() -> int:
@@ -363,9 +621,10 @@ def main() -> int:
     restore_ok = wait_stack_health()
     restore_rto = round(time.time() - restore_start, 3)
 
-    # Verify restore semantics.
-    base_code, _ = request_json("GET", f"{LISTINGS_URL}/listings/{baseline_listing}", headers={"X-Tenant-ID": TENANT_ID})
-    canary_code, _ = request_json("GET", f"{LISTINGS_URL}/listings/{canary_listing}", headers={"X-Tenant-ID": TENANT_ID})
+    # Verify restore semantics. The two lookups are independent, so run them
+    # side by side; the listings themselves bracket the backup and stay ordered.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        base_code, canary_code = pool.map(listing_code, (baseline_listing, canary_listing))
     baseline_exists_after = base_code == 200
     canary_exists_after = canary_code == 200
 
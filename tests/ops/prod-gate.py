@@ -10,19 +10,25 @@ from __future__ import annotations
 import concurrent.futures
 import datetime as dt
 import hashlib
+import heapq
 import hmac
+import http.client
 import json
 import math
 import os
 import pathlib
+import shutil
 import statistics
 import subprocess
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+N = TypeVar("N", int, float)
 
 
 def env(name: str, default: str) -> str:
@@ -30,6 +36,18 @@ def env(name: str, default: str) -> str:
     return value if value not in (None, "") else default
 
 
+def env_number(name: str, default: str, cast: Callable[[str], N]) -> N:
+    # Settings are read at import, before main()'s error handling; report in
+    # the same stdout format rather than with a bare int()/float() traceback.
+    value = env(name, default)
+    try:
+        return cast(value)
+    except ValueError:
+        print("GATE_STATUS=FAIL")
+        print(f"ERROR=invalid {name}={value!r}: expected {cast.__name__}")
+        sys.exit(1)
+
+
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[2]
 ARTIFACTS_DIR = pathlib.Path(env("ARTIFACTS_DIR", str(ROOT_DIR / ".artifacts" / "prod-gate")))
 ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -40,12 +58,14 @@ BOOKINGS_URL = env("BOOKINGS_URL", "http://localhost:8002")
 PAYMENTS_URL = env("PAYMENTS_URL", "http://localhost:8003")
 COMPOSE_FILE = env("COMPOSE_FILE", str(ROOT_DIR / "docker-compose.yml"))
 
-LOAD_EVENTS = int(env("LOAD_EVENTS", "500"))
-LOAD_CONCURRENCY = int(env("LOAD_CONCURRENCY", "20"))
-SOAK_SECONDS = int(env("SOAK_SECONDS", "300"))
-SOAK_INTERVAL_SECONDS = float(env("SOAK_INTERVAL_SECONDS", "1"))
+LOAD_EVENTS = env_number("LOAD_EVENTS", "500", int)
+LOAD_CONCURRENCY = env_number("LOAD_CONCURRENCY", "20", int)
+SOAK_SECONDS = env_number("SOAK_SECONDS", "300", int)
+SOAK_INTERVAL_SECONDS = env_number("SOAK_INTERVAL_SECONDS", "1", float)
+SOAK_CONCURRENCY = env_number("SOAK_CONCURRENCY", "8", int)
+SOAK_DRAIN_TIMEOUT_SECONDS = env_number("SOAK_DRAIN_TIMEOUT_SECONDS", "120", float)
 CHAOS_RESTART = env("CHAOS_RESTART", "true").lower() == "true"
-CHAOS_AT_SEC = int(env("CHAOS_AT_SEC", "60"))
+CHAOS_AT_SEC = env_number("CHAOS_AT_SEC", "60", int)
 CHAOS_SERVICES = env("CHAOS_SERVICES", "bookings payments")
 
 TENANT_A = env("TENANT_A", "prodgate-tenant-a")
@@ -79,6 +99,14 @@ class TenantActors:
     guest_user: str
     guest_email: str
     listing_id: str = ""
+    # Identities are fixed per tenant, so build their headers once rather
+    # than on every flow.
+    host_headers: Dict[str, str] = field(init=False, repr=False)
+    guest_headers: Dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.host_headers = auth_headers(self.host_user, self.tenant_id, self.host_email, HOST_SCOPES)
+        self.guest_headers = auth_headers(self.guest_user, self.tenant_id, self.guest_email, GUEST_SCOPES)
 
 
 def log(msg: str) -> None:
@@ -87,7 +115,7 @@ def log(msg: str) -> None:
 
 def ensure_binaries() -> None:
     for binary in ("docker",):
-        if subprocess.call(["bash", "-lc", f"command -v {binary} >/dev/null 2>&1"]) != 0:
+        if shutil.which(binary) is None:
             raise RuntimeError(f"missing required binary: {binary}")
 
 
@@ -95,36 +123,87 @@ def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# json.dumps builds a new JSONEncoder on every call whenever any option is
+# passed; build the compact one once and reuse it for every request body.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+
+def encode_json(payload: dict) -> bytes:
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+# Keep-alive connections, one per (thread, host). http.client connections are
+# not thread-safe, and the load phase runs flows from a worker pool.
+_conn_local = threading.local()
+
+
+def _connection(parts: urllib.parse.SplitResult) -> Tuple[http.client.HTTPConnection, bool]:
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(parts.netloc)
+    if conn is not None:
+        return conn, True
+    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = conns[parts.netloc] = conn_cls(parts.netloc)
+    return conn, False
+
+
+def _drop_connection(netloc: str) -> None:
+    conn = getattr(_conn_local, "conns", {}).pop(netloc, None)
+    if conn is not None:
+        conn.close()
+
+
 def request_json(
     method: str,
     url: str,
     payload: Optional[dict] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout: float = 10,
+    body: Optional[bytes] = None,
 ) -> Tuple[int, bytes]:
-    body: Optional[bytes] = None
     req_headers = dict(headers or {})
     if payload is not None:
-        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        body = encode_json(payload)
+    if body is not None:
         req_headers.setdefault("Content-Type", "application/json")
-    req = urllib.request.Request(url=url, data=body, method=method)
-    for key, value in req_headers.items():
-        req.add_header(key, value)
 
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.getcode(), resp.read()
-    except urllib.error.HTTPError as http_err:
-        return http_err.code, http_err.read()
-    except Exception as err:  # noqa: BLE001
-        return 0, str(err).encode("utf-8")
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    while True:
+        conn, reused = _connection(parts)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body=body, headers=req_headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as err:
+            _drop_connection(parts.netloc)
+            if reused:
+                # The server closed an idle keep-alive socket (e.g. after a
+                # container restart); retry once on a fresh connection.
+                continue
+            return 0, str(err).encode("utf-8")
+        except Exception as err:  # noqa: BLE001
+            _drop_connection(parts.netloc)
+            return 0, str(err).encode("utf-8")
+        if resp.will_close:
+            _drop_connection(parts.netloc)
+        return resp.status, data
 
 
 def parse_json(data: bytes) -> dict:
     if not data:
         return {}
     try:
-        return json.loads(data.decode("utf-8"))
+        # json.loads detects UTF-8 bytes itself; no intermediate str copy.
+        return json.loads(data)
     except Exception:  # noqa: BLE001
         return {}
 
@@ -138,12 +217,22 @@ def auth_headers(user_id: str, tenant_id: str, email: str, scopes: str) -> Dict[
     }
 
 
+# Cross-tenant isolation probe identity; X-Tenant-ID is filled in per probe.
+CROSS_HEADERS_TEMPLATE = auth_headers("probe-user-cross", "", "cross@example.com", "zist.bookings.read")
+
+
+# Keyed once; webhook_headers copies it so each signature skips the key schedule.
+_WEBHOOK_MAC = hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256) if WEBHOOK_SECRET.strip() else None
+
+
 def webhook_headers(payload_bytes: bytes) -> Dict[str, str]:
-    if not WEBHOOK_SECRET.strip():
+    if _WEBHOOK_MAC is None:
         return {}
     ts = str(now_ms())
-    mac = hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
-    mac.update((ts + "." + payload_bytes.decode("utf-8")).encode("utf-8"))
+    mac = _WEBHOOK_MAC.copy()
+    mac.update(ts.encode("ascii"))
+    mac.update(b".")
+    mac.update(payload_bytes)
     return {
         "x-gp-timestamp": ts,
         "x-gp-signature": "v1=" + mac.hexdigest(),
@@ -151,8 +240,8 @@ def webhook_headers(payload_bytes: bytes) -> Dict[str, str]:
 
 
 def wait_http_health(url: str, timeout_sec: int = 180) -> bool:
-    deadline = time.time() + timeout_sec
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
         code, _ = request_json("GET", url, timeout=3)
         if code == 200:
             return True
@@ -160,32 +249,55 @@ def wait_http_health(url: str, timeout_sec: int = 180) -> bool:
     return False
 
 
-def wait_stack_health() -> bool:
+def wait_stack_health(timeout_sec: int = 180) -> bool:
     targets = [
         f"{GATEWAY_URL}/healthz",
         f"{LISTINGS_URL}/healthz",
         f"{BOOKINGS_URL}/healthz",
         f"{PAYMENTS_URL}/healthz",
     ]
-    return all(wait_http_health(t, timeout_sec=180) for t in targets)
-
-
-def wait_service_healthy(service_name: str, timeout_sec: int = 180) -> bool:
-    cid = f"zist-{service_name}"
-    deadline = time.time() + timeout_sec
-    while time.time() < deadline:
-        inspect_cmd = [
-            "docker",
-            "inspect",
-            "-f",
-            "{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}",
-            cid,
-        ]
-        try:
-            status = subprocess.check_output(inspect_cmd, text=True).strip()
-        except subprocess.CalledProcessError:
-            status = ""
-        if status in ("healthy", "running"):
+    # Probe all services concurrently so the wait is bounded by the slowest
+    # one rather than the sum of all of them; this gates both the run start
+    # and recovery from the chaos restart.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(targets))
+    try:
+        futures = [pool.submit(wait_http_health, t, timeout_sec) for t in targets]
+        for future in concurrent.futures.as_completed(futures, timeout=timeout_sec + 10):
+            if not future.result():
+                return False
+        return True
+    except concurrent.futures.TimeoutError:
+        return False
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def inspect_health(services: List[str]) -> Dict[str, str]:
+    # One `docker inspect` for every container instead of a fork per service.
+    inspect_cmd = [
+        "docker",
+        "inspect",
+        "-f",
+        "{{.Name}} {{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}",
+        *[f"zist-{s}" for s in services],
+    ]
+    try:
+        output = subprocess.check_output(inspect_cmd, text=True)
+    except subprocess.CalledProcessError as err:
+        # Still prints the containers it did find when some are missing.
+        output = err.output or ""
+    statuses: Dict[str, str] = {}
+    for line in output.splitlines():
+        name, _, status = line.strip().partition(" ")
+        statuses[name.lstrip("/").removeprefix("zist-")] = status
+    return statuses
+
+
+def wait_services_healthy(services: List[str], timeout_sec: int = 180) -> bool:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        statuses = inspect_health(services)
+        if all(statuses.get(s) in ("healthy", "running") for s in services):
             return True
         time.sleep(2)
     return False
@@ -198,9 +310,8 @@ def restart_services(services: List[str]) -> bool:
         subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except subprocess.CalledProcessError:
         return False
-    for service in services:
-        if not wait_service_healthy(service):
-            return False
+    if not wait_services_healthy(services):
+        return False
     return wait_stack_health()
 
 
@@ -215,7 +326,7 @@ def create_active_listing(actors: TenantActors, title_suffix: str) -> str:
         "maxGuests": 4,
         "instantBook": True,
     }
-    headers = auth_headers(actors.host_user, actors.tenant_id, actors.host_email, HOST_SCOPES)
+    headers = actors.host_headers
     code, body = request_json("POST", f"{LISTINGS_URL}/listings", payload=payload, headers=headers)
     if code != 201:
         raise RuntimeError(f"create listing failed for {actors.tenant_id}: code={code} body={body.decode('utf-8', 'ignore')}")
@@ -243,15 +354,19 @@ def create_active_listing(actors: TenantActors, title_suffix: str) -> str:
     return listing_id
 
 
+BOOKING_BASE_DATE = dt.date(2030, 1, 1)
+BOOKING_STAY = dt.timedelta(days=2)
+
+
 def booking_dates(index: int) -> Tuple[str, str]:
-    start = dt.date(2030, 1, 1) + dt.timedelta(days=index * 3)
-    end = start + dt.timedelta(days=2)
+    start = BOOKING_BASE_DATE + dt.timedelta(days=index * 3)
+    end = start + BOOKING_STAY
     return start.isoformat(), end.isoformat()
 
 
 def run_payment_capture_flow(index: int, actors: TenantActors, other_tenant_id: str, isolation_probe: bool) -> FlowResult:
-    start = time.time()
-    guest_headers = auth_headers(actors.guest_user, actors.tenant_id, actors.guest_email, GUEST_SCOPES)
+    start = time.monotonic()
+    guest_headers = actors.guest_headers
 
     check_in, check_out = booking_dates(index)
     create_payload = {
@@ -263,11 +378,11 @@ def run_payment_capture_flow(index: int, actors: TenantActors, other_tenant_id:
     }
     code, body = request_json("POST", f"{BOOKINGS_URL}/bookings", payload=create_payload, headers=guest_headers)
     if code != 201:
-        return FlowResult(False, actors.tenant_id, time.time() - start, "", f"create booking failed: {code}")
+        return FlowResult(False, actors.tenant_id, time.monotonic() - start, "", f"create booking failed: {code}")
 
     booking_id = parse_json(body).get("id", "")
     if not booking_id:
-        return FlowResult(False, actors.tenant_id, time.time() - start, "", "create booking missing id")
+        return FlowResult(False, actors.tenant_id, time.monotonic() - start, "", "create booking missing id")
 
     event_payload = {
         "event_id": f"prodgate-{actors.tenant_id}-{index}-{now_ms()}",
@@ -276,48 +391,49 @@ def run_payment_capture_flow(index: int, actors: TenantActors, other_tenant_id:
         "tenant_id": actors.tenant_id,
         "data": {"metadata": {"bookingId": booking_id}},
     }
-    payload_bytes = json.dumps(event_payload, separators=(",", ":")).encode("utf-8")
+    payload_bytes = encode_json(event_payload)
     wh_headers = webhook_headers(payload_bytes)
+    # Send exactly the bytes that were signed rather than re-serializing.
     wh_code, wh_body = request_json(
         "POST",
         f"{PAYMENTS_URL}/webhooks/mashgate",
-        payload=event_payload,
         headers=wh_headers,
+        body=payload_bytes,
     )
     if wh_code != 200:
         return FlowResult(
             False,
             actors.tenant_id,
-            time.time() - start,
+            time.monotonic() - start,
             booking_id,
             f"webhook failed: {wh_code} {wh_body.decode('utf-8', 'ignore')}",
         )
 
+    # Same 7.5s budget as before, but start polling fast and back off so a
+    # prompt confirmation is seen quickly without 30 GETs per slow one.
     confirmed = False
-    for _ in range(30):
+    delay = 0.05
+    deadline = time.monotonic() + 7.5
+    while time.monotonic() < deadline:
         g_code, g_body = request_json("GET", f"{BOOKINGS_URL}/bookings/{booking_id}", headers=guest_headers)
         if g_code == 200:
             status = parse_json(g_body).get("status", "")
             if status == "confirmed":
                 confirmed = True
                 break
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
 
     if not confirmed:
-        return FlowResult(False, actors.tenant_id, time.time() - start, booking_id, "booking not confirmed")
+        return FlowResult(False, actors.tenant_id, time.monotonic() - start, booking_id, "booking not confirmed")
 
     isolation_ok = True
     if isolation_probe:
-        cross_headers = auth_headers(
-            "probe-user-cross",
-            other_tenant_id,
-            "cross@example.com",
-            "zist.bookings.read",
-        )
+        cross_headers = {**CROSS_HEADERS_TEMPLATE, "X-Tenant-ID": other_tenant_id}
         x_code, _ = request_json("GET", f"{BOOKINGS_URL}/bookings/{booking_id}", headers=cross_headers)
         isolation_ok = x_code in (403, 404)
 
-    return FlowResult(True, actors.tenant_id, time.time() - start, booking_id, isolation_ok=isolation_ok)
+    return FlowResult(True, actors.tenant_id, time.monotonic() - start, booking_id, isolation_ok=isolation_ok)
 
 
 def p95(values: List[float]) -> float:
@@ -325,35 +441,45 @@ def p95(values: List[float]) -> float:
         return 0.0
     if len(values) == 1:
         return values[0]
-    sorted_values = sorted(values)
-    idx = max(0, min(len(sorted_values) - 1, math.ceil(len(sorted_values) * 0.95) - 1))
-    return sorted_values[idx]
+    # Nearest-rank p95 is the k-th largest value; selecting the top k (~5% of
+    # the samples) with a heap avoids sorting and copying the whole list.
+    idx = max(0, min(len(values) - 1, math.ceil(len(values) * 0.95) - 1))
+    return heapq.nlargest(len(values) - idx, values)[-1]
 
 
 def summarize(results: List[FlowResult]) -> dict:
     total = len(results)
-    ok_results = [r for r in results if r.ok]
-    failures = [r for r in results if not r.ok]
-    latencies = [r.latency_seconds for r in ok_results]
-    by_tenant = {}
-    for result in ok_results:
-        by_tenant[result.tenant] = by_tenant.get(result.tenant, 0) + 1
-    isolation_failures = [r for r in results if not r.isolation_ok]
+    fail = 0
+    isolation_failures = 0
+    latencies: List[float] = []
+    by_tenant: Dict[str, int] = {}
+    failure_samples: List[str] = []
+    for result in results:
+        if result.ok:
+            latencies.append(result.latency_seconds)
+            by_tenant[result.tenant] = by_tenant.get(result.tenant, 0) + 1
+        else:
+            fail += 1
+            if len(failure_samples) < 5:
+                failure_samples.append(result.error)
+        if not result.isolation_ok:
+            isolation_failures += 1
+    ok = total - fail
     return {
         "total": total,
-        "ok": len(ok_results),
-        "fail": len(failures),
-        "success_pct": round((len(ok_results) / total) * 100, 2) if total else 0.0,
+        "ok": ok,
+        "fail": fail,
+        "success_pct": round((ok / total) * 100, 2) if total else 0.0,
         "p95_seconds": round(p95(latencies), 4),
         "avg_seconds": round(statistics.mean(latencies), 4) if latencies else 0.0,
         "by_tenant": by_tenant,
-        "failure_samples": [f.error for f in failures[:5]],
-        "isolation_failures": len(isolation_failures),
+        "failure_samples": failure_samples,
+        "isolation_failures": isolation_failures,
     }
 
 
 def main() -> int:
-    started_at = time.time()
+    started_at = time.monotonic()
     ensure_binaries()
 
     actors_a = TenantActors(
@@ -380,6 +506,8 @@ def main() -> int:
 
     log(f"load phase started: events={LOAD_EVENTS} concurrency={LOAD_CONCURRENCY}")
     load_results: List[FlowResult] = []
+    # Flows are I/O bound and the pool's workers are reused across all events,
+    # so LOAD_CONCURRENCY bounds in-flight flows just as a semaphore would.
     with concurrent.futures.ThreadPoolExecutor(max_workers=LOAD_CONCURRENCY) as pool:
         futures = []
         for i in range(LOAD_EVENTS):
@@ -398,28 +526,57 @@ def main() -> int:
 
     log(f"soak phase started: seconds={SOAK_SECONDS} interval={SOAK_INTERVAL_SECONDS}")
     soak_results: List[FlowResult] = []
+    # future -> (tenant, submitted_at), in submission order.
+    soak_futures: Dict[concurrent.futures.Future, Tuple[str, float]] = {}
     chaos_done = False
     chaos_attempted = False
-    soak_start = time.time()
+    soak_start = time.monotonic()
     tick = 0
-    while True:
-        elapsed = int(time.time() - soak_start)
-        if elapsed >= SOAK_SECONDS:
-            break
-
-        if CHAOS_RESTART and not chaos_attempted and elapsed >= CHAOS_AT_SEC:
-            chaos_attempted = True
-            services = [s for s in CHAOS_SERVICES.split() if s.strip()]
-            if services:
-                log(f"chaos restart: {' '.join(services)}")
-                chaos_done = restart_services(services)
-                log(f"chaos restart done={str(chaos_done).lower()}")
-
-        tick += 1
-        actor = actors_a if tick % 2 == 0 else actors_b
-        other = TENANT_B if actor.tenant_id == TENANT_A else TENANT_A
-        soak_results.append(run_payment_capture_flow(LOAD_EVENTS + tick, actor, other, tick == 1))
-        time.sleep(max(0.0, SOAK_INTERVAL_SECONDS))
+    # Flows run in the background so one slow flow (e.g. around the chaos
+    # restart) does not stretch the tick cadence and thin out the soak.
+    soak_pool = concurrent.futures.ThreadPoolExecutor(max_workers=SOAK_CONCURRENCY)
+    try:
+        while True:
+            elapsed = int(time.monotonic() - soak_start)
+            if elapsed >= SOAK_SECONDS:
+                break
+
+            if CHAOS_RESTART and not chaos_attempted and elapsed >= CHAOS_AT_SEC:
+                chaos_attempted = True
+                services = [s for s in CHAOS_SERVICES.split() if s.strip()]
+                if services:
+                    # Drain in-flight flows first so none straddles the restart.
+                    concurrent.futures.wait(soak_futures)
+                    log(f"chaos restart: {' '.join(services)}")
+                    chaos_done = restart_services(services)
+                    log(f"chaos restart done={str(chaos_done).lower()}")
+
+            tick += 1
+            actor = actors_a if tick % 2 == 0 else actors_b
+            other = TENANT_B if actor.tenant_id == TENANT_A else TENANT_A
+            future = soak_pool.submit(run_payment_capture_flow, LOAD_EVENTS + tick, actor, other, tick == 1)
+            soak_futures[future] = (actor.tenant_id, time.monotonic())
+            time.sleep(max(0.0, SOAK_INTERVAL_SECONDS))
+
+        # A degraded stack is exactly when flows pile up; count stragglers as
+        # failures instead of aborting, so the summary and artifact still run.
+        concurrent.futures.wait(soak_futures, timeout=SOAK_DRAIN_TIMEOUT_SECONDS)
+        for future, (tenant, submitted_at) in soak_futures.items():
+            if future.done() and not future.cancelled():
+                soak_results.append(future.result())
+            else:
+                future.cancel()
+                soak_results.append(
+                    FlowResult(
+                        False,
+                        tenant,
+                        time.monotonic() - submitted_at,
+                        "",
+                        f"soak flow unfinished after {SOAK_DRAIN_TIMEOUT_SECONDS}s drain",
+                    )
+                )
+    finally:
+        soak_pool.shutdown(wait=False, cancel_futures=True)
 
     soak_summary = summarize(soak_results)
     log(
@@ -450,6 +607,7 @@ def main() -> int:
             "load_concurrency": LOAD_CONCURRENCY,
             "soak_seconds": SOAK_SECONDS,
             "soak_interval_seconds": SOAK_INTERVAL_SECONDS,
+            "soak_concurrency": SOAK_CONCURRENCY,
             "chaos_restart": CHAOS_RESTART,
             "chaos_at_sec": CHAOS_AT_SEC,
             "chaos_services": CHAOS_SERVICES,
@@ -459,13 +617,16 @@ def main() -> int:
         "load": load_summary,
         "soak": soak_summary,
         "chaos_done": chaos_done,
-        "duration_seconds": round(time.time() - started_at, 2),
+        "duration_seconds": round(time.monotonic() - started_at, 2),
         "gate_status": "PASS" if gate_ok else "FAIL",
     }
 
     ts = dt.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     artifact_path = ARTIFACTS_DIR / f"prod-gate-{ts}.json"
-    artifact_path.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+    # Stream into the file instead of building the whole document as one string;
+    # keep the indent, the artifact is linked from release baselines for humans.
+    with artifact_path.open("w", encoding="utf-8") as fh:
+        json.dump(artifact, fh, indent=2)
 
     print(f"GATE_STATUS={artifact['gate_status']}")
     print(f"LOAD_TOTAL={load_summary['total']}")